@@ -1,35 +1,58 @@
 #!/usr/bin/env python3
 # calculator - A simple calculator tool
 
+import operator
 import sys
-import argparse
 
+OPERATIONS = {
+    "add": operator.add,
+    "subtract": operator.sub,
+    "multiply": operator.mul,
+    "divide": operator.truediv,
+}
+
+
+def parse_args(argv):
+    """Parse --operation, --a and --b from argv.
+
+    The common case of exactly those three options is parsed by hand, so
+    argparse is only imported for --help and for reporting bad arguments.
+    """
+    opts = dict(zip(argv[::2], argv[1::2]))
+    if (
+        len(argv) % 2 == 0
+        and opts.keys() == {"--operation", "--a", "--b"}
+        and opts["--operation"] in OPERATIONS
+    ):
+        try:
+            return opts["--operation"], float(opts["--a"]), float(opts["--b"])
+        except ValueError:
+            pass
+
+    import argparse
 
-def main():
     parser = argparse.ArgumentParser(description="Simple calculator")
     parser.add_argument(
         "--operation",
         required=True,
-        choices=["add", "subtract", "multiply", "divide"],
+        choices=list(OPERATIONS),
         help="Operation to perform",
     )
     parser.add_argument("--a", type=float, required=True, help="First number")
     parser.add_argument("--b", type=float, required=True, help="Second number")
 
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
+    return args.operation, args.a, args.b
+
+
+def main():
+    operation, a, b = parse_args(sys.argv[1:])
 
     try:
-        if args.operation == "add":
-            result = args.a + args.b
-        elif args.operation == "subtract":
-            result = args.a - args.b
-        elif args.operation == "multiply":
-            result = args.a * args.b
-        elif args.operation == "divide":
-            if args.b == 0:
-                print("Error: Division by zero", file=sys.stderr)
-                sys.exit(1)
-            result = args.a / args.b
+        if operation == "divide" and b == 0:
+            print("Error: Division by zero", file=sys.stderr)
+            sys.exit(1)
+        result = OPERATIONS[operation](a, b)
 
         print(f"Result: {result}")
         sys.exit(0)
@@ -0,0 +1,40 @@
+"""
+ANSI escape helpers shared by the pretty scripts.
+"""
+
+import functools
+import re
+
+# Matches ANSI escape sequences (compiled once at import)
+ANSI_RE = re.compile(r"\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])")
+
+# Resets all colors and attributes
+RESET = "\033[0m"
+
+# 6x6x6 color cube level (0-5) for every 8-bit channel value
+CUBE_LEVELS = bytes(int((v / 255.0) * 5) for v in range(256))
+
+
+def strip_ansi(text):
+    """Remove ANSI escape sequences from text."""
+    # Most text has no escapes at all, so skip the regex for it
+    if "\x1b" not in text:
+        return text
+    return ANSI_RE.sub("", text)
+
+
+def rgb_truecolor(r, g, b):
+    """Convert RGB to ANSI truecolor escape code."""
+    return f"\033[38;2;{r};{g};{b}m"
+
+
+@functools.lru_cache(maxsize=None)
+def rgb_256(r, g, b):
+    """Convert RGB to ANSI 256-color code."""
+    # Use 6x6x6 color cube (216 colors) + 16 standard colors = 232 colors
+    if r == g == b and r < 8:
+        return 16  # Black
+    if r == g == b and r > 248:
+        return 231  # White
+    # Map to 6x6x6 cube (16-231)
+    return 16 + CUBE_LEVELS[r] * 36 + CUBE_LEVELS[g] * 6 + CUBE_LEVELS[b]
@@ -3,9 +3,10 @@
 Combine orla_cat.txt and orla_logo.txt side by side, aligning their bottoms.
 """
 
-import re
 from pathlib import Path
 
+from _ansi import strip_ansi
+
 # Get the script directory and project root
 SCRIPT_DIR = Path(__file__).parent
 PROJECT_ROOT = SCRIPT_DIR.parent
@@ -14,8 +15,19 @@ SHARE_DIR = PROJECT_ROOT / "share"
 
 def get_display_width(line):
     """Get the display width of a line, ignoring ANSI escape sequences."""
-    ansi_escape = re.compile(r"\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])")
-    return len(ansi_escape.sub("", line.rstrip()))
+    return len(strip_ansi(line.rstrip()))
+
+
+def combined_rows(cat_lines, cat_widths, logo_lines, cat_width):
+    """Yield each combined row, newline terminated, one at a time."""
+    for cat_line, cat_display_width, logo_line in zip(
+        cat_lines, cat_widths, logo_lines
+    ):
+        # Pad cat line to its max width; escape sequences take up characters
+        # but no display width, so pad relative to the line's own length
+        pad_target = len(cat_line) + cat_width - cat_display_width
+
+        yield cat_line.ljust(pad_target) + "  " + logo_line + "\n"
 
 
 def combine_banner():
@@ -25,14 +37,12 @@ def combine_banner():
     output_file = SHARE_DIR / "orla_banner.txt"
 
     # Read both files
-    with open(cat_file, "r") as f:
-        cat_lines = [line.rstrip("\n") for line in f.readlines()]
+    cat_lines = cat_file.read_text(encoding="utf-8").splitlines()
+    logo_lines = logo_file.read_text(encoding="utf-8").splitlines()
 
-    with open(logo_file, "r") as f:
-        logo_lines = [line.rstrip("\n") for line in f.readlines()]
-
-    # Find the maximum width of cat lines (for padding)
-    cat_width = max(get_display_width(line) for line in cat_lines) if cat_lines else 0
+    # Display width of each cat line, and the maximum width (for padding)
+    cat_widths = [get_display_width(line) for line in cat_lines]
+    cat_width = max(cat_widths) if cat_widths else 0
 
     # Align bottoms: pad cat at the top
     cat_len = len(cat_lines)
@@ -42,35 +52,18 @@ def combine_banner():
         # Pad cat at the top with empty lines
         padding = [""] * (logo_len - cat_len)
         cat_lines = padding + cat_lines
+        cat_widths = [0] * len(padding) + cat_widths
     elif logo_len < cat_len:
         # Pad logo at the top with empty lines
         padding = [""] * (cat_len - logo_len)
         logo_lines = padding + logo_lines
 
-    # Combine line by line
-    combined = []
-    for i in range(len(cat_lines)):
-        cat_line = cat_lines[i]
-        logo_line = logo_lines[i]
-
-        # Pad cat line to its max width
-        cat_display_width = get_display_width(cat_line)
-        padding = (
-            " " * (cat_width - cat_display_width)
-            if cat_display_width < cat_width
-            else ""
-        )
-
-        combined_line = cat_line + padding + "  " + logo_line
-        combined.append(combined_line)
-
-    # Write to output file
+    # Combine line by line, streaming rows to the output file
     with open(output_file, "w") as f:
-        f.write("\n".join(combined))
-        f.write("\n")
+        f.writelines(combined_rows(cat_lines, cat_widths, logo_lines, cat_width))
 
     print(f"Created {output_file}")
-    print(f"Cat lines: {cat_len}, Logo lines: {logo_len}, Combined: {len(combined)}")
+    print(f"Cat lines: {cat_len}, Logo lines: {logo_len}, Combined: {len(cat_lines)}")
 
 
 if __name__ == "__main__":
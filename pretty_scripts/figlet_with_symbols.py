@@ -4,9 +4,17 @@ Convert figlet output to use custom symbols and colors.
 Usage: python3 figlet_with_symbols.py [font] [text] [symbol_set] [color]
 """
 
-import argparse
+import re
+import shutil
+import string
 import sys
 import subprocess
+import types
+
+from _ansi import RESET, rgb_truecolor
+
+# Resolve figlet on PATH once per process
+FIGLET = shutil.which("figlet") or "figlet"
 
 # Define symbol sets
 SYMBOL_SETS = {
@@ -33,62 +41,100 @@ COLORS = {
     "none": None,  # No color
 }
 
+# ANSI truecolor escape code for each color, None for no color
+COLOR_CODES = {
+    name: None if rgb is None else rgb_truecolor(*rgb) for name, rgb in COLORS.items()
+}
+
+# Character classes mapped to symbols by replace_with_symbols
+PUNCTUATION_CHARS = ".,;:!?"
+SPECIAL_CHARS = "\"'*^%=+@><"
+
 
-def rgb_to_ansi(r, g, b):
-    """Convert RGB to ANSI truecolor escape code."""
-    return f"\033[38;2;{r};{g};{b}m"
+def build_translate_table(symbols):
+    """Build a str.translate table mapping character classes to symbols."""
+    # Letters and numbers -> main symbol
+    table = {ord(c): symbols["main"] for c in string.ascii_letters + string.digits}
+    # Punctuation -> dark symbol
+    table.update({ord(c): symbols["dark"] for c in PUNCTUATION_CHARS})
+    # Special chars -> medium symbol
+    table.update({ord(c): symbols["medium"] for c in SPECIAL_CHARS})
+    # Everything else (spaces, newlines) is kept as is
+    return table
+
+
+# Translation tables for each symbol set, built once at import
+TRANSLATE_TABLES = {
+    name: build_translate_table(symbols) for name, symbols in SYMBOL_SETS.items()
+}
+
+# The same character classes as a single pattern, for lines with non-ASCII
+# characters; [^\W_] matches exactly the characters str.isalnum() accepts.
+# Each group is named after the symbol it is replaced with.
+SYMBOL_PATTERN = re.compile(
+    r"(?P<main>[^\W_])"
+    rf"|(?P<dark>[{re.escape(PUNCTUATION_CHARS)}])"
+    rf"|(?P<medium>[{re.escape(SPECIAL_CHARS)}])"
+)
 
 
 def apply_color(text, color_name):
     """Apply color to text if color is specified."""
-    if color_name == "none" or color_name not in COLORS:
+    color_code = COLOR_CODES.get(color_name)
+    if color_code is None:
         return text
 
-    rgb = COLORS[color_name]
-    if rgb is None:
-        return text
-
-    color_code = rgb_to_ansi(*rgb)
-    reset = "\033[0m"
-
     # Apply color to each line (but preserve ANSI codes if any)
-    lines = text.split("\n")
-    colored_lines = []
-    for line in lines:
-        if line.strip():
-            colored_lines.append(f"{color_code}{line}{reset}")
-        else:
-            colored_lines.append(line)
-
-    return "\n".join(colored_lines)
+    return "\n".join(
+        color_code + line + RESET if line.strip() else line for line in text.split("\n")
+    )
 
 
 def replace_with_symbols(text, symbol_set):
     """Replace characters in text with symbols."""
-    symbols = SYMBOL_SETS.get(symbol_set, SYMBOL_SETS["blocks"])
-
-    result = []
-    for line in text:
-        new_line = ""
-        for char in line:
-            if char.isalnum():
-                # Letters and numbers -> main symbol
-                new_line += symbols["main"]
-            elif char in ".,;:!?":
-                # Punctuation -> dark symbol
-                new_line += symbols["dark"]
-            elif char in "\"'*^%=+@><":
-                # Special chars -> medium symbol
-                new_line += symbols["medium"]
-            else:
-                # Keep spaces and newlines
-                new_line += char
-        result.append(new_line)
-
-    return result
-
+    if symbol_set not in SYMBOL_SETS:
+        symbol_set = "blocks"
+    table = TRANSLATE_TABLES[symbol_set]
+    symbols = SYMBOL_SETS[symbol_set]
+
+    def replace(match):
+        return symbols[match.lastgroup]
+
+    # The translate tables only cover ASCII, so other lines go through the
+    # regex to keep str.isalnum() semantics for non-ASCII letters and digits
+    return [
+        line.translate(table) if line.isascii() else SYMBOL_PATTERN.sub(replace, line)
+        for line in text
+    ]
+
+
+# Defaults for the positional arguments, in order
+POSITIONAL_DEFAULTS = ["fraktur", "Orla", "blocks", "none"]
+
+
+def parse_args(argv):
+    """Parse command line arguments.
+
+    Plain positional invocations are parsed by hand, so argparse is only
+    imported when flags are passed or the arguments need to be reported
+    as invalid.
+    """
+    if len(argv) <= len(POSITIONAL_DEFAULTS) and not any(
+        arg.startswith("-") for arg in argv
+    ):
+        font, text, symbol_set, color = argv + POSITIONAL_DEFAULTS[len(argv) :]
+        if symbol_set in SYMBOL_SETS and color in COLORS:
+            return types.SimpleNamespace(
+                font=font,
+                text=text,
+                symbol_set=symbol_set,
+                color=color,
+                no_symbol_replace=False,
+                no_color=False,
+            )
+
+    import argparse
 
-def main():
     parser = argparse.ArgumentParser(
         description="Convert figlet output to use custom symbols and colors.",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -138,17 +184,20 @@ Examples:
         help="Skip color application, output plain text",
     )
 
-    args = parser.parse_args()
+    return parser.parse_args(argv)
+
+
+def main():
+    args = parse_args(sys.argv[1:])
 
     # Generate figlet output
     try:
         result = subprocess.run(
-            ["figlet", "-f", args.font, args.text],
+            [FIGLET, "-f", args.font, args.text],
             capture_output=True,
-            text=True,
             check=True,
         )
-        figlet_output = result.stdout
+        figlet_output = result.stdout.decode("utf-8", "replace")
     except subprocess.CalledProcessError:
         print(
             f"Error: Could not generate figlet output with font '{args.font}'",
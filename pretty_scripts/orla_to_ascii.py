@@ -6,21 +6,33 @@ Usage: python3 orla_to_ascii.py <image_path> [width]
 
 import pathlib
 import sys
-from PIL import Image
 
+import numpy as np
 
-def rgb_to_ansi(r, g, b):
-    """Convert RGB to ANSI 256-color code."""
-    # Use 6x6x6 color cube (216 colors) + 16 standard colors = 232 colors
-    if r == g == b and r < 8:
-        return 16  # Black
-    if r == g == b and r > 248:
-        return 231  # White
+from _ansi import CUBE_LEVELS, RESET
+
+# ANSI 256-color foreground escape for every color code, as bytes
+ANSI_PREFIXES = [f"\033[38;5;{code}m".encode("ascii") for code in range(256)]
+ANSI_RESET = RESET.encode("ascii")
+
+# CUBE_LEVELS as an array, for indexing with whole images
+CUBE_LEVELS_ARRAY = np.frombuffer(CUBE_LEVELS, dtype=np.uint8).astype(np.int32)
+# Weight of each cube level within the 6x6x6 cube
+CUBE_WEIGHTS = np.array([36, 6, 1], dtype=np.int32)
+
+
+def rgb_to_ansi_array(rgb):
+    """Convert an array of RGB pixels to ANSI 256-color codes.
+
+    Vectorized equivalent of _ansi.rgb_256 over the last axis of rgb.
+    """
     # Map to 6x6x6 cube (16-231)
-    r6 = int((r / 255.0) * 5)
-    g6 = int((g / 255.0) * 5)
-    b6 = int((b / 255.0) * 5)
-    return 16 + (r6 * 36) + (g6 * 6) + b6
+    codes = 16 + CUBE_LEVELS_ARRAY[rgb] @ CUBE_WEIGHTS
+    r, g, b = rgb[..., 0], rgb[..., 1], rgb[..., 2]
+    gray = (r == g) & (g == b)
+    codes[gray & (r < 8)] = 16  # Black
+    codes[gray & (r > 248)] = 231  # White
+    return codes
 
 
 def orla_to_ascii(image_path: pathlib.Path, width: int) -> str:
@@ -29,6 +41,9 @@ def orla_to_ascii(image_path: pathlib.Path, width: int) -> str:
     Args:
         width: Output width in characters
     """
+    # Imported here so usage errors don't pay for loading PIL
+    from PIL import Image
+
     # Open image
     img = Image.open(image_path)
     aspect_ratio = img.height / img.width
@@ -37,53 +52,60 @@ def orla_to_ascii(image_path: pathlib.Path, width: int) -> str:
     resampling = Image.Resampling.NEAREST
     img = img.resize((width, height), resampling)
 
-    # ASCII characters from darkest to lightest
-    ascii_chars = "█"
+    # Opaque pixels are drawn with this character, transparent ones with a space
+    glyphs = ["█".encode("utf-8"), b" "]
 
-    # Convert to RGBA to handle transparency
-    if img.mode != "RGBA":
-        img = img.convert("RGBA")
+    # Convert to RGBA to handle transparency, or to RGB for opaque images
+    has_alpha = "A" in img.mode or "transparency" in img.info
+    mode = "RGBA" if has_alpha else "RGB"
+    if img.mode != mode:
+        img = img.convert(mode)
+
+    pixels = np.asarray(img)
+    rgb = pixels[..., :3]
+
+    # Get ANSI color codes and the glyph index of every pixel; with a single
+    # character there is no brightness ramp, so luminance isn't needed
+    ansi_codes = rgb_to_ansi_array(rgb)
+    char_idx = np.zeros_like(ansi_codes)
+
+    if has_alpha:
+        # If pixel is transparent or very transparent, use space
+        # Threshold for transparency (0-255, 128 = 50% opacity)
+        transparent = pixels[..., 3] < 128
+        char_idx[transparent] = 1
+        ansi_codes[transparent] = 16  # Black color for transparent areas
+
+    # Emit one escape prefix and reset per run of identical colored characters
+    n_glyphs = len(glyphs)
+    cell_idx = ansi_codes * n_glyphs + char_idx
+
+    # Bind hot lookups to locals for the per-run loop
+    prefixes = ANSI_PREFIXES
+    reset = ANSI_RESET
 
     output = []
-    pixels = img.load()
-
-    for y in range(height):
-        line = ""
-        for x in range(width):
-            r, g, b, a = pixels[x, y]
-
-            # If pixel is transparent or very transparent, use space
-            if a < 128:  # Threshold for transparency (0-255, 128 = 50% opacity)
-                char = " "
-                ansi_code = 16  # Black color for transparent areas
-            else:
-                # Calculate luminance (perceived brightness) using standard formula
-                # This matches human eye sensitivity better than simple average
-                luminance = 0.299 * r + 0.587 * g + 0.114 * b
-                # Darken the image to match original better
-                # Multiply by a factor < 1.0 to make it darker (closer to original)
-                darkened = (
-                    luminance * 0.3
-                )  # Adjust this value (0.2-0.9) to fine-tune darkness
-                # Map to ASCII character
-                # Clamp to ensure we don't exceed bounds
-                char_idx = min(
-                    int((darkened / 255.0) * (len(ascii_chars) - 1)),
-                    len(ascii_chars) - 1,
-                )
-                char = ascii_chars[char_idx]
-                # Get ANSI color code
-                ansi_code = rgb_to_ansi(r, g, b)
-
-            # Add colored character
-            line += f"\033[38;5;{ansi_code}m{char}\033[0m"
-        output.append(line)
-
-    return "\n".join(output)
+    for row in cell_idx:
+        # Start of every run in this row, plus the end of the last run
+        starts = np.flatnonzero(np.diff(row)) + 1
+        bounds = [0, *starts.tolist(), len(row)]
+        runs = zip(bounds, bounds[1:], row[bounds[:-1]].tolist())
+        output.append(
+            b"".join(
+                [
+                    prefixes[idx // n_glyphs]
+                    + glyphs[idx % n_glyphs] * (end - start)
+                    + reset
+                    for start, end, idx in runs
+                ]
+            )
+        )
+
+    return b"\n".join(output).decode("utf-8")
 
 
 if __name__ == "__main__":
-    if len(sys.argv) < 1:
+    if len(sys.argv) < 2:
         print(
             "Usage: python3 orla_to_ascii.py image_path [width]",
             file=sys.stderr,